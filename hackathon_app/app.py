@@ -6,7 +6,6 @@ AI-Powered tire wear analysis for Toyota GR Cup racing data.
 """
 
 import streamlit as st
-from utils.model_predictor import get_model_metadata
 from utils.data_loader import get_available_tracks
 
 
@@ -30,8 +29,12 @@ st.header("📊 Dashboard Overview")
 
 col1, col2, col3 = st.columns(3)
 
-# Load model metadata for stats
+# Load model metadata once (reused by the sidebar below)
+metadata = None
 try:
+    # Imported here so the model stack loads after the page starts rendering
+    from utils.model_predictor import get_model_metadata
+
     metadata = get_model_metadata()
 
     with col1:
@@ -212,7 +215,6 @@ with st.sidebar:
 
     st.markdown("### Model Performance")
     try:
-        metadata = get_model_metadata()
         st.markdown(f"""
         - **R² Score**: {metadata['best_test_r2']:.3f}
         - **MAE**: {metadata['best_test_mae']:.3f} sec/lap
@@ -14,8 +14,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.data_loader import (
     get_available_tracks,
+    get_tracks_by_name,
     get_available_laps,
-    get_gps_availability,
     load_lap_telemetry,
     load_lap_gps,
     get_lap_features,
@@ -23,8 +23,8 @@ from utils.data_loader import (
 )
 from utils.model_predictor import predict_lap_degradation, interpret_degradation
 from utils.track_plotter import (
-    plot_track_with_overlay,
-    create_telemetry_charts,
+    cached_track_plot,
+    cached_telemetry_charts,
     create_degradation_meter
 )
 
@@ -52,8 +52,8 @@ with st.sidebar:
             help="Choose a racing circuit to analyze"
         )
 
-        # Get GPS availability stats
-        gps_stats = get_gps_availability(selected_track)
+        # Get GPS availability stats (already computed per track)
+        gps_stats = get_tracks_by_name()[selected_track]
 
         # Show GPS availability
         if gps_stats['laps_with_gps'] > 0:
@@ -119,21 +119,23 @@ with st.sidebar:
         # Limit to top 20 after sorting
         laps_df = laps_df.head(20)
 
-        # Create lap options with metadata
-        lap_options = []
-        for _, lap in laps_df.iterrows():
-            gps_indicator = "📍" if lap['has_gps'] else "❌"
-            lap_label = f"{gps_indicator} Lap #{lap['lap_number']} - {lap['lap_duration']:.2f}s (Car {lap['car_number']})"
-            lap_options.append((lap_label, lap['lap_id']))
+        # Create lap options with metadata (vectorized label construction)
+        gps_indicator = laps_df['has_gps'].astype(bool).map({True: "📍", False: "❌"})
+        lap_labels = (
+            gps_indicator + " Lap #" + laps_df['lap_number'].astype(str)
+            + " - " + laps_df['lap_duration'].map('{:.2f}'.format)
+            + "s (Car " + laps_df['car_number'].astype(str) + ")"
+        )
+        lap_id_by_label = dict(zip(lap_labels, laps_df['lap_id'].tolist()))
 
         selected_lap_label = st.selectbox(
             f"Select Lap (showing top {len(laps_df)})",
-            options=[label for label, _ in lap_options],
+            options=lap_labels.tolist(),
             help="Choose a lap to visualize"
         )
 
         # Get selected lap ID
-        selected_lap_id = next(lid for label, lid in lap_options if label == selected_lap_label)
+        selected_lap_id = lap_id_by_label[selected_lap_label]
 
         # Get lap metadata
         lap_meta = get_lap_metadata(selected_lap_id)
@@ -159,10 +161,11 @@ with col1:
 
         if gps_data is not None and not gps_data.empty:
             # Plot track with GPS overlay
-            fig = plot_track_with_overlay(
+            fig = cached_track_plot(
                 track_name=selected_track,
-                gps_data=gps_data,
-                title=f"{selected_track.title()} - Lap {lap_meta['lap_number']}"
+                lap_id=selected_lap_id,
+                title=f"{selected_track.title()} - Lap {lap_meta['lap_number']}",
+                _gps_data=gps_data
             )
             st.plotly_chart(fig, width='stretch')
 
@@ -170,8 +173,9 @@ with col1:
         else:
             # No GPS - show track image only
             st.warning("⚠️ No GPS data available for this lap")
-            fig = plot_track_with_overlay(
+            fig = cached_track_plot(
                 track_name=selected_track,
+                lap_id=selected_lap_id,
                 title=f"{selected_track.title()} - Lap {lap_meta['lap_number']}"
             )
             st.plotly_chart(fig, width='stretch')
@@ -188,7 +192,7 @@ with col1:
 
         if not telemetry_df.empty:
             # Create charts
-            speed_fig, brake_fig, g_fig = create_telemetry_charts(telemetry_df)
+            speed_fig, brake_fig, g_fig = cached_telemetry_charts(selected_lap_id, telemetry_df)
 
             # Display in columns
             tcol1, tcol2 = st.columns(2)
@@ -20,11 +20,6 @@ from utils.data_loader import (
     get_lap_features,
     get_lap_metadata
 )
-from utils.model_predictor import (
-    what_if_prediction,
-    interpret_degradation,
-    get_coaching_insights
-)
 
 
 st.set_page_config(page_title="What-If Analysis", page_icon="🎮", layout="wide")
@@ -60,17 +55,19 @@ with st.sidebar:
                 st.warning(f"No laps for {selected_track}")
                 st.stop()
 
-            lap_options = []
-            for _, lap in laps_df.iterrows():
-                lap_label = f"Lap #{lap['lap_number']} - {lap['lap_duration']:.2f}s (Car {lap['car_number']})"
-                lap_options.append((lap_label, lap['lap_id']))
+            lap_labels = (
+                "Lap #" + laps_df['lap_number'].astype(str)
+                + " - " + laps_df['lap_duration'].map('{:.2f}'.format)
+                + "s (Car " + laps_df['car_number'].astype(str) + ")"
+            )
+            lap_id_by_label = dict(zip(lap_labels, laps_df['lap_id'].tolist()))
 
             selected_lap_label = st.selectbox(
                 "Lap",
-                options=[label for label, _ in lap_options]
+                options=lap_labels.tolist()
             )
 
-            selected_lap_id = next(lid for label, lid in lap_options if label == selected_lap_label)
+            selected_lap_id = lap_id_by_label[selected_lap_label]
 
         else:
             # Show representative laps (simplified)
@@ -83,18 +80,21 @@ with st.sidebar:
                 st.stop()
 
             # Create lap options with lap_type as primary label
-            lap_options = []
-            for _, lap in rep_laps_df.iterrows():
-                lap_label = f"{lap['lap_type']}: {lap['lap_duration']:.2f}s (Lap #{lap['lap_number']}, Car {lap['car_number']})"
-                lap_options.append((lap_label, lap['lap_id']))
+            lap_labels = (
+                rep_laps_df['lap_type'].astype(str)
+                + ": " + rep_laps_df['lap_duration'].map('{:.2f}'.format)
+                + "s (Lap #" + rep_laps_df['lap_number'].astype(str)
+                + ", Car " + rep_laps_df['car_number'].astype(str) + ")"
+            )
+            lap_id_by_label = dict(zip(lap_labels, rep_laps_df['lap_id'].tolist()))
 
             selected_lap_label = st.selectbox(
                 "Representative Lap",
-                options=[label for label, _ in lap_options],
+                options=lap_labels.tolist(),
                 help="Fast = Top 10% | Average = Median | Slow = Bottom 10-20%"
             )
 
-            selected_lap_id = next(lid for label, lid in lap_options if label == selected_lap_label)
+            selected_lap_id = lap_id_by_label[selected_lap_label]
 
         lap_meta = get_lap_metadata(selected_lap_id)
         st.success(f"✅ Base lap selected")
@@ -105,6 +105,17 @@ with st.sidebar:
 
 st.markdown("---")
 
+# Deferred until a lap is selected so the sidebar renders before the model stack loads
+from utils.model_predictor import (
+    WHATIF_SLIDER_STEPS,
+    WHATIF_SLIDER_FEATURES,
+    apply_adjustments,
+    precompute_whatif_grid,
+    whatif_grid_index,
+    interpret_degradation,
+    get_coaching_insights
+)
+
 # Load base lap features
 try:
     with st.spinner("Loading lap data..."):
@@ -139,48 +150,51 @@ with st.expander("ℹ️ Feature Sensitivity Guide", expanded=False):
     *Note: Small slider changes (5-10%) may show minimal delta due to model learning.*
     """)
 
+
+def slider_bounds(slider: str) -> dict:
+    """Slider min/max/step taken from the What-If prediction grid axis."""
+    steps = WHATIF_SLIDER_STEPS[slider]
+    return dict(
+        min_value=int(steps[0]),
+        max_value=int(steps[-1]),
+        step=int(steps[1] - steps[0])
+    )
+
+
 col1, col2 = st.columns(2)
 
 with col1:
     lateral_g_adj = st.slider(
         "🔄 Cornering Aggression (Lateral G)",
-        min_value=-30,
-        max_value=30,
         value=0,
-        step=5,
         format="%d%%",
-        help="Adjust lateral G-forces (cornering speed). Higher = more aggressive cornering."
+        help="Adjust lateral G-forces (cornering speed). Higher = more aggressive cornering.",
+        **slider_bounds('lateral_g')
     )
 
     steering_adj = st.slider(
         "🎯 Steering Smoothness",
-        min_value=-40,
-        max_value=40,
         value=0,
-        step=5,
         format="%d%%",
-        help="Adjust steering variance. Negative = smoother inputs (MOST IMPACTFUL)"
+        help="Adjust steering variance. Negative = smoother inputs (MOST IMPACTFUL)",
+        **slider_bounds('steering')
     )
 
 with col2:
     brake_adj = st.slider(
         "🛑 Brake Pressure",
-        min_value=-30,
-        max_value=30,
         value=0,
-        step=5,
         format="%d%%",
-        help="Adjust brake pressure (low model impact)"
+        help="Adjust brake pressure (low model impact)",
+        **slider_bounds('brake')
     )
 
     throttle_adj = st.slider(
         "⚡ Throttle Application",
-        min_value=-20,
-        max_value=20,
         value=0,
-        step=5,
         format="%d%%",
-        help="Adjust throttle blade position (low model impact)"
+        help="Adjust throttle blade position (low model impact)",
+        **slider_bounds('throttle')
     )
 
 st.markdown("---")
@@ -189,31 +203,31 @@ st.markdown("---")
 # Create unique key based on all slider values to ensure predictions update
 prediction_key = f"{brake_adj}_{steering_adj}_{lateral_g_adj}_{throttle_adj}"
 
-adjustments = {}
+slider_values = {
+    'lateral_g': lateral_g_adj,
+    'steering': steering_adj,
+    'brake': brake_adj,
+    'throttle': throttle_adj
+}
 
-if lateral_g_adj != 0:
-    adjustments['avg_lateral_g'] = lateral_g_adj
-    adjustments['max_lateral_g'] = lateral_g_adj
-
-if steering_adj != 0:
-    adjustments['steering_variance'] = steering_adj
-
-if brake_adj != 0:
-    adjustments['avg_brake_front'] = brake_adj
-    adjustments['max_brake_front'] = brake_adj
-
-if throttle_adj != 0:
-    adjustments['avg_throttle_blade'] = throttle_adj
+# Map each non-zero slider onto the features it scales
+adjustments = {
+    feature_name: pct
+    for slider, pct in slider_values.items() if pct != 0
+    for feature_name in WHATIF_SLIDER_FEATURES[slider]
+}
 
 # Display active adjustments for debugging
 if adjustments:
     st.info(f"🔧 Active adjustments: {', '.join([f'{k}: {v:+}%' for k, v in adjustments.items()])}")
 
 try:
-    baseline_pred, adjusted_pred, modified_features = what_if_prediction(
-        base_features,
-        adjustments
-    )
+    # All slider combinations are predicted once per lap; slider moves are lookups
+    whatif_grid = precompute_whatif_grid(selected_lap_id, base_features)
+
+    baseline_pred = float(whatif_grid[whatif_grid_index()])
+    adjusted_pred = float(whatif_grid[whatif_grid_index(**slider_values)])
+    modified_features = apply_adjustments(base_features, adjustments)
 
     # Results section
     st.header("📊 Results")
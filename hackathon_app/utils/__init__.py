@@ -1,66 +1,55 @@
 """
 Utility modules for Tire Whisperer Dashboard
-"""
-
-from .data_loader import (
-    get_available_tracks,
-    get_available_laps,
-    load_lap_telemetry,
-    load_lap_gps,
-    get_lap_features,
-    get_vehicle_stats,
-    get_all_vehicles,
-    get_lap_metadata
-)
 
-from .model_predictor import (
-    load_model,
-    predict_degradation,
-    predict_lap_degradation,
-    what_if_prediction,
-    get_feature_importance,
-    calculate_efficiency_score,
-    get_coaching_insights,
-    interpret_degradation
-)
+Submodules are imported lazily on first attribute access, so importing
+utils.data_loader does not also load the model and plotting stacks.
+"""
 
-from .track_plotter import (
-    load_track_image,
-    plot_track_with_overlay,
-    create_telemetry_charts,
-    create_degradation_meter,
-    create_radar_chart,
-    create_comparison_table,
-    create_feature_importance_chart,
-    animate_lap_trace
-)
+import importlib
 
-__all__ = [
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Data loader
-    'get_available_tracks',
-    'get_available_laps',
-    'load_lap_telemetry',
-    'load_lap_gps',
-    'get_lap_features',
-    'get_vehicle_stats',
-    'get_all_vehicles',
-    'get_lap_metadata',
+    'get_available_tracks': 'data_loader',
+    'get_tracks_by_name': 'data_loader',
+    'get_available_laps': 'data_loader',
+    'load_lap_telemetry': 'data_loader',
+    'load_lap_gps': 'data_loader',
+    'get_lap_features': 'data_loader',
+    'get_lap_features_batch': 'data_loader',
+    'get_vehicle_stats': 'data_loader',
+    'get_all_vehicles': 'data_loader',
+    'get_lap_metadata': 'data_loader',
     # Model predictor
-    'load_model',
-    'predict_degradation',
-    'predict_lap_degradation',
-    'what_if_prediction',
-    'get_feature_importance',
-    'calculate_efficiency_score',
-    'get_coaching_insights',
-    'interpret_degradation',
+    'load_model': 'model_predictor',
+    'predict_degradation': 'model_predictor',
+    'predict_lap_degradation': 'model_predictor',
+    'what_if_prediction': 'model_predictor',
+    'apply_adjustments': 'model_predictor',
+    'precompute_whatif_grid': 'model_predictor',
+    'whatif_grid_index': 'model_predictor',
+    'get_feature_importance': 'model_predictor',
+    'calculate_efficiency_score': 'model_predictor',
+    'get_coaching_insights': 'model_predictor',
+    'interpret_degradation': 'model_predictor',
     # Track plotter
-    'load_track_image',
-    'plot_track_with_overlay',
-    'create_telemetry_charts',
-    'create_degradation_meter',
-    'create_radar_chart',
-    'create_comparison_table',
-    'create_feature_importance_chart',
-    'animate_lap_trace'
-]
+    'load_track_image': 'track_plotter',
+    'plot_track_with_overlay': 'track_plotter',
+    'create_telemetry_charts': 'track_plotter',
+    'cached_track_plot': 'track_plotter',
+    'cached_telemetry_charts': 'track_plotter',
+    'create_degradation_meter': 'track_plotter',
+    'create_radar_chart': 'track_plotter',
+    'create_comparison_table': 'track_plotter',
+    'create_feature_importance_chart': 'track_plotter',
+    'animate_lap_trace': 'track_plotter'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -27,9 +27,13 @@ DB_CONFIG = {
 }
 
 
+@st.cache_resource
 def get_db_engine():
     """
-    Create a SQLAlchemy database engine.
+    Create a SQLAlchemy database engine (cached for the process lifetime).
+
+    Sharing one engine keeps its connection pool alive across queries and
+    reruns instead of opening a fresh connection for every cache miss.
 
     Returns:
         SQLAlchemy engine object
@@ -88,6 +92,18 @@ def get_available_tracks() -> pd.DataFrame:
     return df
 
 
+@st.cache_data(ttl=600)
+def get_tracks_by_name() -> Dict[str, Dict]:
+    """
+    Get per-track stats from get_available_tracks() keyed by track name.
+
+    Returns:
+        Dictionary mapping track_name to a dict with track_id, total_laps,
+        laps_with_gps, gps_coverage_pct
+    """
+    return get_available_tracks().set_index('track_name').to_dict(orient='index')
+
+
 @st.cache_data(ttl=600)
 def get_available_laps(track_name: str, limit: int = 100) -> pd.DataFrame:
     """
@@ -289,6 +305,57 @@ def get_vehicle_stats(vehicle_id: int) -> Dict:
     return stats
 
 
+# Per-lap ML feature aggregation (23 features) shared by get_lap_features and
+# get_lap_features_batch; callers append their own WHERE / GROUP BY and must
+# pass params (the modulo is escaped as %% for psycopg2)
+LAP_FEATURES_SELECT = """
+    -- Weather features (with defaults if no weather data)
+    COALESCE(MAX(wd.air_temp), 25.0) as air_temp,
+    COALESCE(MAX(wd.track_temp), 30.0) as track_temp,
+    COALESCE(MAX(wd.humidity), 50.0) as humidity,
+    COALESCE(MAX(wd.wind_speed), 5.0) as wind_speed,
+    COALESCE(MAX(wd.track_temp) - MAX(wd.air_temp), 5.0) as temp_delta,
+
+    -- Brake pressure features
+    COALESCE(AVG(tr.pbrake_f), 0.0) as avg_brake_front,
+    COALESCE(MAX(tr.pbrake_f), 0.0) as max_brake_front,
+    COALESCE(AVG(tr.pbrake_r), 0.0) as avg_brake_rear,
+    COALESCE(MAX(tr.pbrake_r), 0.0) as max_brake_rear,
+
+    -- G-force features
+    COALESCE(AVG(ABS(tr.accy_can)), 0.0) as avg_lateral_g,
+    COALESCE(MAX(ABS(tr.accy_can)), 0.0) as max_lateral_g,
+    COALESCE(AVG(tr.accx_can), 0.0) as avg_long_g,
+    COALESCE(MAX(tr.accx_can), 0.0) as max_accel_g,
+    COALESCE(MIN(tr.accx_can), 0.0) as max_brake_g,
+
+    -- Steering features
+    COALESCE(STDDEV(tr.steering_angle), 0.0) as steering_variance,
+    COALESCE(AVG(ABS(tr.steering_angle)), 0.0) as avg_steering_angle,
+
+    -- Throttle features
+    COALESCE(AVG(tr.ath), 0.0) as avg_throttle_blade,
+
+    -- Speed features
+    COALESCE(AVG(tr.speed), 0.0) as avg_speed,
+    COALESCE(MAX(tr.speed), 0.0) as max_speed,
+    COALESCE(MIN(tr.speed), 0.0) as min_speed,
+
+    -- Engine features
+    COALESCE(AVG(tr.nmot), 0.0) as avg_rpm,
+    COALESCE(MAX(tr.nmot), 0.0) as max_rpm,
+
+    -- Stint position (approximate from lap number)
+    l.lap_number %% 15 as lap_in_stint
+
+FROM laps l
+LEFT JOIN telemetry_readings tr ON l.lap_id = tr.lap_id
+LEFT JOIN sessions s ON l.session_id = s.session_id
+LEFT JOIN races r ON s.race_id = r.race_id
+LEFT JOIN weather_data wd ON r.race_id = wd.race_id
+"""
+
+
 @st.cache_data(ttl=600)
 def get_lap_features(lap_id: int) -> Optional[pd.Series]:
     """
@@ -302,52 +369,7 @@ def get_lap_features(lap_id: int) -> Optional[pd.Series]:
     """
     log_data_operation(logger, "get_lap_features", lap_id=lap_id)
 
-    query = """
-    SELECT
-        -- Weather features (with defaults if no weather data)
-        COALESCE(MAX(wd.air_temp), 25.0) as air_temp,
-        COALESCE(MAX(wd.track_temp), 30.0) as track_temp,
-        COALESCE(MAX(wd.humidity), 50.0) as humidity,
-        COALESCE(MAX(wd.wind_speed), 5.0) as wind_speed,
-        COALESCE(MAX(wd.track_temp) - MAX(wd.air_temp), 5.0) as temp_delta,
-
-        -- Brake pressure features
-        COALESCE(AVG(tr.pbrake_f), 0.0) as avg_brake_front,
-        COALESCE(MAX(tr.pbrake_f), 0.0) as max_brake_front,
-        COALESCE(AVG(tr.pbrake_r), 0.0) as avg_brake_rear,
-        COALESCE(MAX(tr.pbrake_r), 0.0) as max_brake_rear,
-
-        -- G-force features
-        COALESCE(AVG(ABS(tr.accy_can)), 0.0) as avg_lateral_g,
-        COALESCE(MAX(ABS(tr.accy_can)), 0.0) as max_lateral_g,
-        COALESCE(AVG(tr.accx_can), 0.0) as avg_long_g,
-        COALESCE(MAX(tr.accx_can), 0.0) as max_accel_g,
-        COALESCE(MIN(tr.accx_can), 0.0) as max_brake_g,
-
-        -- Steering features
-        COALESCE(STDDEV(tr.steering_angle), 0.0) as steering_variance,
-        COALESCE(AVG(ABS(tr.steering_angle)), 0.0) as avg_steering_angle,
-
-        -- Throttle features
-        COALESCE(AVG(tr.ath), 0.0) as avg_throttle_blade,
-
-        -- Speed features
-        COALESCE(AVG(tr.speed), 0.0) as avg_speed,
-        COALESCE(MAX(tr.speed), 0.0) as max_speed,
-        COALESCE(MIN(tr.speed), 0.0) as min_speed,
-
-        -- Engine features
-        COALESCE(AVG(tr.nmot), 0.0) as avg_rpm,
-        COALESCE(MAX(tr.nmot), 0.0) as max_rpm,
-
-        -- Stint position (approximate from lap number)
-        l.lap_number %% 15 as lap_in_stint
-
-    FROM laps l
-    LEFT JOIN telemetry_readings tr ON l.lap_id = tr.lap_id
-    LEFT JOIN sessions s ON l.session_id = s.session_id
-    LEFT JOIN races r ON s.race_id = r.race_id
-    LEFT JOIN weather_data wd ON r.race_id = wd.race_id
+    query = "SELECT" + LAP_FEATURES_SELECT + """
     WHERE l.lap_id = %s
     GROUP BY l.lap_id, l.lap_number;
     """
@@ -406,6 +428,56 @@ def get_lap_features(lap_id: int) -> Optional[pd.Series]:
         raise
 
 
+@st.cache_data(ttl=600)
+def get_lap_features_batch(lap_ids: List[int]) -> pd.DataFrame:
+    """
+    Get ML feature vectors for several laps with a single query.
+
+    Args:
+        lap_ids: Lap IDs to load
+
+    Returns:
+        DataFrame indexed by lap_id with the 23 model features per lap.
+        Laps with no data or more than 50% null features are omitted.
+    """
+    log_data_operation(logger, "get_lap_features_batch", n_laps=len(lap_ids))
+
+    if not lap_ids:
+        return pd.DataFrame()
+
+    query = "SELECT\n        l.lap_id," + LAP_FEATURES_SELECT + """
+    WHERE l.lap_id = ANY(%s)
+    GROUP BY l.lap_id, l.lap_number;
+    """
+
+    try:
+        engine = get_db_engine()
+        # Convert numpy.int64 to Python int (psycopg2 compatibility)
+        lap_ids = [int(lap_id) for lap_id in lap_ids]
+        df = pd.read_sql(query, engine, params=(lap_ids,)).set_index('lap_id')
+
+        # Drop laps where most features are null (indicates bad data)
+        null_fraction = df.isnull().mean(axis=1)
+        bad_laps = df.index[null_fraction > 0.5].tolist()
+        if bad_laps:
+            logger.warning(f"Too many null values for lap_ids={bad_laps}, skipping")
+            df = df.drop(index=bad_laps)
+
+        missing = sorted(set(lap_ids) - set(df.index))
+        if missing:
+            logger.warning(f"No features available for lap_ids={missing}")
+
+        logger.info(f"Loaded features for {len(df)}/{len(lap_ids)} laps")
+        return df
+
+    except SQLAlchemyError as e:
+        log_exception(logger, e, f"Database error while loading features for {len(lap_ids)} laps")
+        raise
+    except Exception as e:
+        log_exception(logger, e, f"Unexpected error while loading features for {len(lap_ids)} laps")
+        raise
+
+
 @st.cache_data(ttl=600)
 def get_all_vehicles() -> pd.DataFrame:
     """
@@ -584,52 +656,3 @@ def get_representative_laps(track_name: str) -> pd.DataFrame:
     except Exception as e:
         log_exception(logger, e, f"Error loading representative laps for track '{track_name}'")
         raise
-
-
-@st.cache_data(ttl=600)
-def get_gps_availability(track_name: str) -> Dict:
-    """
-    Get GPS availability statistics for a track.
-
-    Args:
-        track_name: Name of the track
-
-    Returns:
-        Dictionary with total_laps, laps_with_gps, gps_coverage_pct
-    """
-    query = """
-    SELECT
-        COUNT(DISTINCT l.lap_id) as total_laps,
-        COUNT(DISTINCT CASE WHEN EXISTS (
-            SELECT 1 FROM telemetry_readings tr
-            WHERE tr.lap_id = l.lap_id
-            AND tr.vbox_lat_min IS NOT NULL
-            LIMIT 1
-        ) THEN l.lap_id END) as laps_with_gps
-    FROM laps l
-    JOIN sessions s ON l.session_id = s.session_id
-    JOIN races r ON s.race_id = r.race_id
-    JOIN tracks t ON r.track_id = t.track_id
-    WHERE t.track_name = %s
-      AND l.lap_number < 32768
-      AND l.lap_number > 0;
-    """
-
-    try:
-        engine = get_db_engine()
-        df = pd.read_sql(query, engine, params=(track_name,))
-
-        if df.empty:
-            return {'total_laps': 0, 'laps_with_gps': 0, 'gps_coverage_pct': 0.0}
-
-        result = df.iloc[0].to_dict()
-        result['gps_coverage_pct'] = (
-            (result['laps_with_gps'] / result['total_laps'] * 100)
-            if result['total_laps'] > 0 else 0.0
-        )
-
-        return result
-
-    except Exception as e:
-        log_exception(logger, e, f"Error getting GPS availability for track '{track_name}'")
-        return {'total_laps': 0, 'laps_with_gps': 0, 'gps_coverage_pct': 0.0}
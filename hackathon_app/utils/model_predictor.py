@@ -28,6 +28,24 @@ FEATURE_NAMES = [
     'avg_speed', 'max_speed', 'min_speed', 'avg_rpm', 'max_rpm', 'lap_in_stint'
 ]
 
+# Column index of each feature in FEATURE_NAMES (precomputed for array lookups)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+# What-If slider axes (percent changes; page 2 builds its sliders from these)
+# and the features each slider scales
+WHATIF_SLIDER_STEPS = {
+    'lateral_g': np.arange(-30, 31, 5),
+    'steering': np.arange(-40, 41, 5),
+    'brake': np.arange(-30, 31, 5),
+    'throttle': np.arange(-20, 21, 5),
+}
+WHATIF_SLIDER_FEATURES = {
+    'lateral_g': ['avg_lateral_g', 'max_lateral_g'],
+    'steering': ['steering_variance'],
+    'brake': ['avg_brake_front', 'max_brake_front'],
+    'throttle': ['avg_throttle_blade'],
+}
+
 
 @st.cache_resource
 def load_model():
@@ -172,6 +190,28 @@ def predict_lap_degradation(lap_features: pd.Series) -> float:
         raise
 
 
+def apply_adjustments(base_features: pd.Series, adjustments: Dict[str, float]) -> pd.Series:
+    """
+    Apply percentage adjustments to a copy of the lap features.
+
+    Args:
+        base_features: Original lap features (Series)
+        adjustments: Dictionary of feature adjustments as percentages
+
+    Returns:
+        Modified feature Series
+    """
+    modified_features = base_features.copy()
+
+    feature_names = [f for f in adjustments if f in modified_features]
+    if feature_names:
+        # Apply all percentage changes in one vectorized multiply
+        pct_changes = np.array([adjustments[f] for f in feature_names], dtype=float)
+        modified_features[feature_names] = base_features[feature_names] * (1 + pct_changes / 100)
+
+    return modified_features
+
+
 def what_if_prediction(base_features: pd.Series, adjustments: Dict[str, float]) -> Tuple[float, float, pd.Series]:
     """
     Perform what-if analysis by adjusting driving parameters.
@@ -188,13 +228,7 @@ def what_if_prediction(base_features: pd.Series, adjustments: Dict[str, float])
     baseline_pred = predict_lap_degradation(base_features)
 
     # Create modified features
-    modified_features = base_features.copy()
-
-    for feature_name, pct_change in adjustments.items():
-        if feature_name in modified_features:
-            # Apply percentage change
-            original_value = base_features[feature_name]
-            modified_features[feature_name] = original_value * (1 + pct_change / 100)
+    modified_features = apply_adjustments(base_features, adjustments)
 
     # Get adjusted prediction
     adjusted_pred = predict_lap_degradation(modified_features)
@@ -202,6 +236,66 @@ def what_if_prediction(base_features: pd.Series, adjustments: Dict[str, float])
     return baseline_pred, adjusted_pred, modified_features
 
 
+@st.cache_data(show_spinner=False)
+def precompute_whatif_grid(lap_id: int, _base_features: pd.Series) -> np.ndarray:
+    """
+    Predict degradation for every What-If slider combination of a lap.
+
+    Builds one feature row per point of the slider grid (meshgrid over
+    WHATIF_SLIDER_STEPS) and runs a single batched model.predict, which is
+    far cheaper than one single-row predict per slider change.
+
+    Args:
+        lap_id: Lap ID the base features belong to (cache key)
+        _base_features: Original lap features (not hashed)
+
+    Returns:
+        Array of predictions with one axis per slider, in WHATIF_SLIDER_STEPS
+        order; index it with whatif_grid_index()
+    """
+    base = pd.to_numeric(
+        _base_features.reindex(FEATURE_NAMES), errors='coerce'
+    ).to_numpy(dtype=float)
+
+    grids = np.meshgrid(*WHATIF_SLIDER_STEPS.values(), indexing='ij')
+    X = np.tile(base, (grids[0].size, 1))
+
+    for slider, pct_grid in zip(WHATIF_SLIDER_STEPS, grids):
+        factor = 1 + pct_grid.ravel() / 100
+        for feature_name in WHATIF_SLIDER_FEATURES[slider]:
+            X[:, FEATURE_INDEX[feature_name]] *= factor
+
+    logger.debug(f"Precomputing What-If grid for lap {lap_id}: {X.shape[0]} scenarios")
+    predictions = predict_degradation(pd.DataFrame(X, columns=FEATURE_NAMES))
+
+    return predictions.reshape(grids[0].shape)
+
+
+def whatif_grid_index(**slider_values: int) -> Tuple[int, ...]:
+    """
+    Convert slider percentages to an index into precompute_whatif_grid().
+
+    Args:
+        **slider_values: Percent change per slider (e.g., brake=-10);
+                         sliders not given default to 0
+
+    Returns:
+        Tuple index into the prediction grid
+
+    Raises:
+        ValueError: If a value is not one of the slider's grid steps
+    """
+    index = []
+    for slider, steps in WHATIF_SLIDER_STEPS.items():
+        value = slider_values.get(slider, 0)
+        i = int(np.searchsorted(steps, value))
+        if i >= len(steps) or steps[i] != value:
+            raise ValueError(f"{slider}={value} is not on the What-If grid {steps.tolist()}")
+        index.append(i)
+
+    return tuple(index)
+
+
 def get_feature_importance() -> pd.DataFrame:
     """
     Get feature importance rankings from the trained model.
@@ -303,9 +397,10 @@ def get_coaching_insights(baseline_pred: float, adjusted_pred: float, adjustment
     return insights
 
 
+@st.cache_resource
 def get_model_metadata() -> Dict:
     """
-    Get model metadata (performance metrics, training info).
+    Get model metadata (performance metrics, training info, cached).
 
     Returns:
         Dictionary with model metadata
@@ -259,6 +259,53 @@ def create_telemetry_charts(telemetry_df: pd.DataFrame) -> Tuple[go.Figure, go.F
     return speed_fig, brake_fig, g_fig
 
 
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def cached_track_plot(
+    track_name: str,
+    lap_id: int,
+    title: str,
+    _gps_data: Optional[pd.DataFrame] = None
+) -> go.Figure:
+    """
+    Cached wrapper around plot_track_with_overlay for a single lap.
+
+    The cache key is (track_name, lap_id, title); the leading underscore keeps
+    Streamlit from hashing the GPS DataFrame on every rerun.
+
+    Args:
+        track_name: Name of track
+        lap_id: Lap ID the GPS data belongs to
+        title: Plot title
+        _gps_data: DataFrame with 'latitude', 'longitude' columns (optional)
+
+    Returns:
+        Plotly Figure object
+    """
+    return plot_track_with_overlay(
+        track_name=track_name,
+        gps_data=_gps_data,
+        title=title
+    )
+
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def cached_telemetry_charts(
+    lap_id: int,
+    _telemetry_df: pd.DataFrame
+) -> Tuple[go.Figure, go.Figure, go.Figure]:
+    """
+    Cached wrapper around create_telemetry_charts, keyed on lap_id.
+
+    Args:
+        lap_id: Lap ID the telemetry belongs to
+        _telemetry_df: DataFrame with telemetry columns (not hashed)
+
+    Returns:
+        Tuple of 3 Plotly figures (speed_chart, brake_chart, g_force_chart)
+    """
+    return create_telemetry_charts(_telemetry_df)
+
+
 def create_degradation_meter(degradation_value: float, max_value: float = 1.5) -> go.Figure:
     """
     Create a gauge/meter chart for tire degradation.
@@ -159,10 +159,10 @@ SELECT
     ROUND(MIN(CASE WHEN l.is_valid_lap THEN l.lap_duration END), 3) as best_lap_time,
     ROUND(STDDEV(CASE WHEN l.is_valid_lap THEN l.lap_duration END), 3) as lap_time_std,
     -- Telemetry aggregates
-    ROUND(AVG(tr.speed), 2) as avg_speed,
-    ROUND(MAX(tr.speed), 2) as max_speed,
-    ROUND(AVG(tr.nmot), 2) as avg_rpm,
-    ROUND(AVG(tr.ath), 2) as avg_throttle
+    ROUND(AVG(tr.speed)::numeric, 2) as avg_speed,
+    ROUND(MAX(tr.speed)::numeric, 2) as max_speed,
+    ROUND(AVG(tr.nmot)::numeric, 2) as avg_rpm,
+    ROUND(AVG(tr.ath)::numeric, 2) as avg_throttle
 FROM vehicles v
 LEFT JOIN laps l ON v.vehicle_id = l.vehicle_id
 LEFT JOIN telemetry_readings tr ON l.lap_id = tr.lap_id
@@ -181,17 +181,17 @@ SELECT
     ROUND(AVG(l.lap_duration), 2) as avg_lap_time,
     ROUND(MIN(l.lap_duration), 2) as fastest_lap,
     -- Speed analysis
-    ROUND(AVG(tr.speed), 2) as avg_speed,
-    ROUND(MAX(tr.speed), 2) as max_speed_recorded,
-    ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY tr.speed), 2) as speed_95th_percentile,
+    ROUND(AVG(tr.speed)::numeric, 2) as avg_speed,
+    ROUND(MAX(tr.speed)::numeric, 2) as max_speed_recorded,
+    ROUND((PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY tr.speed))::numeric, 2) as speed_95th_percentile,
     -- G-force analysis
-    ROUND(AVG(ABS(tr.accx_can)), 3) as avg_longitudinal_g,
-    ROUND(AVG(ABS(tr.accy_can)), 3) as avg_lateral_g,
-    ROUND(MAX(tr.accx_can), 3) as max_acceleration,
-    ROUND(MIN(tr.accx_can), 3) as max_braking,
+    ROUND(AVG(ABS(tr.accx_can))::numeric, 3) as avg_longitudinal_g,
+    ROUND(AVG(ABS(tr.accy_can))::numeric, 3) as avg_lateral_g,
+    ROUND(MAX(tr.accx_can)::numeric, 3) as max_acceleration,
+    ROUND(MIN(tr.accx_can)::numeric, 3) as max_braking,
     -- Braking analysis
-    ROUND(AVG(tr.pbrake_f), 2) as avg_front_brake,
-    ROUND(MAX(tr.pbrake_f), 2) as max_front_brake
+    ROUND(AVG(tr.pbrake_f)::numeric, 2) as avg_front_brake,
+    ROUND(MAX(tr.pbrake_f)::numeric, 2) as max_front_brake
 FROM tracks t
 JOIN races r ON t.track_id = r.track_id
 JOIN sessions s ON r.race_id = s.race_id
@@ -0,0 +1,38 @@
+-- ================================================================
+-- Migration: telemetry_readings sensor columns DECIMAL -> REAL
+-- ================================================================
+-- schema.sql creates telemetry_readings with REAL/SMALLINT sensor
+-- columns. Databases loaded before that change still use DECIMAL;
+-- run this once to bring them in line with schema.sql.
+--
+-- Notes:
+-- - Rewrites the whole table (several GB): run during downtime.
+-- - The preprocessing views depend on these columns and must be
+--   dropped first; re-create them afterwards with
+--   sql/views/create_preprocessing_views.sql
+-- ================================================================
+
+BEGIN;
+
+DROP VIEW IF EXISTS vehicle_aggression_profile;
+DROP VIEW IF EXISTS stint_degradation;
+DROP VIEW IF EXISTS lap_aggression_metrics;
+
+ALTER TABLE telemetry_readings
+    ALTER COLUMN speed TYPE REAL,
+    ALTER COLUMN gear TYPE SMALLINT,
+    ALTER COLUMN nmot TYPE REAL,
+    ALTER COLUMN ath TYPE REAL,
+    ALTER COLUMN aps TYPE REAL,
+    ALTER COLUMN pbrake_f TYPE REAL,
+    ALTER COLUMN pbrake_r TYPE REAL,
+    ALTER COLUMN accx_can TYPE REAL,
+    ALTER COLUMN accy_can TYPE REAL,
+    ALTER COLUMN steering_angle TYPE REAL,
+    ALTER COLUMN vbox_long_minutes TYPE DOUBLE PRECISION,
+    ALTER COLUMN vbox_lat_min TYPE DOUBLE PRECISION,
+    ALTER COLUMN laptrigger_lapdist_dls TYPE REAL;
+
+COMMIT;
+
+-- Then: psql -d gr_cup_racing -f sql/views/create_preprocessing_views.sql
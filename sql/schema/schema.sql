@@ -128,6 +128,8 @@ CREATE INDEX idx_laps_valid ON laps(is_valid_lap);
 
 -- Telemetry Readings: High-frequency sensor data (PIVOTED from EAV)
 -- Note: This is the largest table - consider partitioning for production
+-- Existing databases created with DECIMAL sensor columns: apply
+-- sql/schema/migrate_telemetry_real.sql to match this definition
 CREATE TABLE telemetry_readings (
     telemetry_id BIGSERIAL PRIMARY KEY,
     lap_id BIGINT REFERENCES laps(lap_id),
@@ -136,20 +138,20 @@ CREATE TABLE telemetry_readings (
     timestamp_ecu TIMESTAMP,
     meta_time TIMESTAMP NOT NULL,
     outing INTEGER,
-    -- Telemetry parameters
-    speed DECIMAL(10, 4),              -- Vehicle speed (km/h)
-    gear INTEGER,                       -- Current gear selection
-    nmot DECIMAL(10, 2),               -- Engine RPM
-    ath DECIMAL(10, 4),                -- Throttle blade position (%)
-    aps DECIMAL(10, 4),                -- Accelerator pedal position (%)
-    pbrake_f DECIMAL(10, 4),           -- Front brake pressure (bar)
-    pbrake_r DECIMAL(10, 4),           -- Rear brake pressure (bar)
-    accx_can DECIMAL(10, 6),           -- Forward/backward acceleration (G)
-    accy_can DECIMAL(10, 6),           -- Lateral acceleration (G)
-    steering_angle DECIMAL(10, 4),     -- Steering wheel angle (degrees)
-    vbox_long_minutes DECIMAL(15, 10), -- GPS longitude
-    vbox_lat_min DECIMAL(15, 10),      -- GPS latitude
-    laptrigger_lapdist_dls DECIMAL(10, 4), -- Distance from start/finish (m)
+    -- Telemetry parameters (float4: sensor precision fits in 32 bits)
+    speed REAL,                        -- Vehicle speed (km/h)
+    gear SMALLINT,                     -- Current gear selection
+    nmot REAL,                         -- Engine RPM
+    ath REAL,                          -- Throttle blade position (%)
+    aps REAL,                          -- Accelerator pedal position (%)
+    pbrake_f REAL,                     -- Front brake pressure (bar)
+    pbrake_r REAL,                     -- Rear brake pressure (bar)
+    accx_can REAL,                     -- Forward/backward acceleration (G)
+    accy_can REAL,                     -- Lateral acceleration (G)
+    steering_angle REAL,               -- Steering wheel angle (degrees)
+    vbox_long_minutes DOUBLE PRECISION, -- GPS longitude (needs > 7 significant digits)
+    vbox_lat_min DOUBLE PRECISION,     -- GPS latitude (needs > 7 significant digits)
+    laptrigger_lapdist_dls REAL,       -- Distance from start/finish (m)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 